@@ -1,555 +1,951 @@
-"""
-PingOps v1.1
-Developer: ASG-DEVS (Abdullah Saad Alghamdi)
-
-A lightweight multi-IP monitoring tool for Network & NOC engineers.
-Features:
-- Multiple simultaneous ping windows
-- Real-time UP/DOWN/FLAPPING detection
-- Continuous ping
-- Names/labels per IP
-- Excel export
-- Clean PyQt5 dark UI
-"""
-
-import sys
-import subprocess
-import threading
-import platform
-import pandas as pd
-from pathlib import Path
-
-from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QLabel, QPlainTextEdit, QScrollArea, QFrame, QMessageBox,
-    QDialog, QFileDialog
-)
-from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt, pyqtSignal, QObject
-
-
-# ---------------------------------------------------------
-# Resource Path (supports PyInstaller EXE)
-# ---------------------------------------------------------
-def resource_path(relative_path: str) -> str:
-    """Return absolute path to resource for both script & PyInstaller."""
-    base_path = getattr(sys, "_MEIPASS", Path(__file__).parent)
-    return str(Path(base_path) / relative_path)
-
-
-# ---------------------------------------------------------
-# Ping Thread Signal
-# ---------------------------------------------------------
-class PingSignals(QObject):
-    status_signal = pyqtSignal(str, str)  # ip, reply
-
-
-# ---------------------------------------------------------
-# Single IP Widget
-# ---------------------------------------------------------
-class PingWidget(QWidget):
-    def __init__(self, main_window, ip: str, name: str = ""):
-        super().__init__()
-        self.main_window = main_window
-        self.ip = ip
-        self.name = name
-
-        self.thread_running = False
-        self.thread = None
-        self.signals = PingSignals()
-        self.last_status = None  # For FLAPPING detection
-
-        # ---------------- UI Layout ----------------
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(8, 8, 8, 8)
-        main_layout.setSpacing(4)
-
-        # Row 1: IP + Name
-        ip_row = QHBoxLayout()
-        self.ip_label = QLabel(self.ip)
-        self.ip_label.setStyleSheet("color: #FFFFFF; font-size: 13px; font-weight: bold;")
-        ip_row.addWidget(self.ip_label)
-
-        self.name_label = QLabel(self.name)
-        self.name_label.setStyleSheet("color: #CCCCCC; font-size: 12px;")
-        ip_row.addStretch()
-        ip_row.addWidget(self.name_label)
-        main_layout.addLayout(ip_row)
-
-        # Row 2: Status box + Reply
-        status_row = QHBoxLayout()
-
-        self.status_box = QFrame()
-        self.status_box.setFixedSize(130, 32)
-        self.status_box.setStyleSheet("""
-            QFrame {
-                background-color: #333333;
-                border-radius: 10px;
-                border: 1px solid #555555;
-            }
-        """)
-
-        status_inner = QHBoxLayout(self.status_box)
-        status_inner.setContentsMargins(8, 0, 8, 0)
-
-        self.icon_label = QLabel("•")
-        self.icon_label.setStyleSheet("color: #AAAAAA; font-size: 18px;")
-
-        self.status_text = QLabel("Unknown")
-        self.status_text.setStyleSheet("color: #DDDDDD; font-size: 11px;")
-
-        status_inner.addWidget(self.icon_label)
-        status_inner.addWidget(self.status_text)
-
-        status_row.addWidget(self.status_box)
-
-        self.reply_label = QLabel("Waiting...")
-        self.reply_label.setWordWrap(True)
-        self.reply_label.setStyleSheet("color: #BBBBBB; font-size: 11px;")
-        status_row.addWidget(self.reply_label, 1)
-
-        main_layout.addLayout(status_row)
-
-        # Row 3: Buttons
-        btn_row = QHBoxLayout()
-        self.start_btn = QPushButton("Start")
-        self.stop_btn = QPushButton("Stop")
-        self.delete_btn = QPushButton("Delete")
-
-        for b in (self.start_btn, self.stop_btn, self.delete_btn):
-            b.setCursor(Qt.PointingHandCursor)
-
-        btn_row.addWidget(self.start_btn)
-        btn_row.addWidget(self.stop_btn)
-        btn_row.addWidget(self.delete_btn)
-        btn_row.addStretch()
-        main_layout.addLayout(btn_row)
-
-        self.setLayout(main_layout)
-
-        # Connect signals
-        self.signals.status_signal.connect(self.update_status)
-        self.start_btn.clicked.connect(self.start_ping)
-        self.stop_btn.clicked.connect(self.stop_ping)
-        self.delete_btn.clicked.connect(self.request_delete)
-
-        # Button Style
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #3A3A3A;
-                color: white;
-                padding: 4px 10px;
-                border-radius: 6px;
-                border: 1px solid #555555;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-        """)
-
-    # ---------------------------------------------------------
-    # Delete widget
-    # ---------------------------------------------------------
-    def request_delete(self):
-        if QMessageBox.question(
-            self, "Confirm delete",
-            f"Delete ping window for {self.ip}?",
-            QMessageBox.Yes | QMessageBox.No
-        ) == QMessageBox.Yes:
-            self.main_window.remove_widget(self)
-
-    # ---------------------------------------------------------
-    # Update Visual Status
-    # ---------------------------------------------------------
-    def update_status(self, ip: str, reply: str):
-        if "Reply from" in reply or "bytes=" in reply:
-            status = "UP"
-            grad = ("#225522", "#2E7D32")
-            icon_char, icon_color = "✔", "#A5D6A7"
-
-        elif "Request timed out" in reply:
-            status = "DOWN"
-            grad = ("#552222", "#C62828")
-            icon_char, icon_color = "✖", "#EF9A9A"
-
-        else:
-            status = "DOWN"
-            grad = ("#552222", "#C62828")
-            icon_char, icon_color = "✖", "#EF9A9A"
-
-        # FLAPPING detection
-        if self.last_status and self.last_status != status:
-            status = "FLAPPING"
-            grad = ("#665500", "#FBC02D")
-            icon_char, icon_color = "⚠", "#FFE082"
-
-        self.last_status = status
-
-        # Apply Styles
-        self.status_box.setStyleSheet(f"""
-            QFrame {{
-                background-color: qlineargradient(
-                    x1: 0, y1: 0, x2: 1, y2: 0,
-                    stop: 0 {grad[0]}, stop: 1 {grad[1]}
-                );
-                border-radius: 10px;
-                border: 1px solid #666666;
-            }}
-        """)
-
-        self.icon_label.setText(icon_char)
-        self.icon_label.setStyleSheet(f"color: {icon_color}; font-size: 16px;")
-        self.status_text.setText(status)
-        self.reply_label.setText(reply)
-
-        # Save result in main window
-        self.main_window.ping_results[self.ip] = (status, self.name)
-
-    # ---------------------------------------------------------
-    # Ping Thread
-    # ---------------------------------------------------------
-    def start_ping(self):
-        if not self.thread_running:
-            self.thread_running = True
-            self.thread = threading.Thread(target=self.run_ping, daemon=True)
-            self.thread.start()
-
-    def stop_ping(self):
-        self.thread_running = False
-
-    def run_ping(self):
-        is_win = platform.system().lower() == "windows"
-        param = "-n" if is_win else "-c"
-
-        startupinfo = None
-        if is_win:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-        while self.thread_running:
-            result = subprocess.run(
-                ["ping", param, "1", self.ip],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                startupinfo=startupinfo
-            )
-
-            if result.returncode == 0:
-                line = next(
-                    (l for l in result.stdout.splitlines()
-                     if "Reply from" in l or "bytes=" in l),
-                    "Reply received"
-                )
-            else:
-                line = "Request timed out."
-
-            self.signals.status_signal.emit(self.ip, line)
-
-
-# ---------------------------------------------------------
-# Help / About Dialog
-# ---------------------------------------------------------
-class HelpDialog(QDialog):
-    def __init__(self):
-        super().__init__()
-        self.setWindowTitle("About PingOps")
-        self.resize(460, 360)
-        self.setStyleSheet("background-color: #1E1E1E; color: white;")
-
-        layout = QVBoxLayout()
-
-        header = QLabel("PingOps v1.1")
-        header.setStyleSheet("font-size: 20px; font-weight: bold; color: #4CAF50;")
-        layout.addWidget(header)
-
-        text = QLabel()
-        text.setWordWrap(True)
-        text.setTextFormat(Qt.RichText)
-        text.setOpenExternalLinks(True)
-        text.setStyleSheet("font-size: 13px; color: #DDDDDD;")
-        text.setText("""
-<b>English:</b><br>
-PingOps is a lightweight professional IP monitoring tool designed for NOC engineers.<br>
-• Monitor multiple IPs<br>
-• Real-time UP / DOWN / FLAPPING detection<br>
-• Export results to Excel<br><br>
-<b>Developer:</b> Abdullah Al-Ghamdi<br>
-<a href="https://www.linkedin.com/in/abdullah-saad-alghamdi-553b67167/" style="color:#4CAF50;">LinkedIn Profile</a><br><br>
-<hr>
-<b>العربية:</b><br>
-PingOps أداة احترافية لمراقبة الشبكات ومهندسي الـ NOC.<br>
-• مراقبة عدة IPs<br>
-• كشف UP / DOWN / FLAPPING<br>
-• تصدير النتائج لملف Excel<br><br>
-شكراً لاستخدامك PingOps ❤️
-        """)
-        layout.addWidget(text)
-
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
-        close_btn.setCursor(Qt.PointingHandCursor)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3A3A3A;
-                color: white;
-                padding: 6px 12px;
-                border-radius: 6px;
-                border: 1px solid #555555;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-            }
-        """)
-        layout.addWidget(close_btn, alignment=Qt.AlignRight)
-
-        self.setLayout(layout)
-
-
-# ---------------------------------------------------------
-# Main Window
-# ---------------------------------------------------------
-class MainWindow(QWidget):
-    def __init__(self):
-        super().__init__()
-
-        self.setWindowTitle("PingOps Dashboard v1.1")
-        self.resize(900, 700)
-        self.setWindowIcon(QIcon(resource_path("pingops_final.ico")))
-        self.setStyleSheet("background-color: #121212; color: white;")
-
-        self.widgets = []
-        self.existing_ips = set()
-        self.ping_results = {}
-
-        root = QVBoxLayout()
-        root.setContentsMargins(0, 0, 0, 0)
-
-        # Top Bar
-        top = QFrame()
-        top.setStyleSheet("""
-            QFrame {
-                background-color: #202020;
-                border-bottom: 1px solid #333333;
-            }
-        """)
-        top_layout = QHBoxLayout(top)
-        top_layout.setContentsMargins(12, 6, 12, 6)
-
-        icon = QLabel()
-        icon.setPixmap(QIcon(resource_path("pingops_final.ico")).pixmap(22, 22))
-
-        title = QLabel("PingOps Dashboard v1.1")
-        title.setStyleSheet("font-size: 14px; font-weight: bold;")
-
-        top_layout.addWidget(icon)
-        top_layout.addWidget(title)
-        top_layout.addStretch()
-
-        root.addWidget(top)
-
-        # Content Layout
-        content = QVBoxLayout()
-        content.setContentsMargins(10, 10, 10, 10)
-
-        # Two input text boxes
-        row = QHBoxLayout()
-
-        self.ip_box = QPlainTextEdit()
-        self.ip_box.setPlaceholderText("Paste IP list (one IP per line)")
-        self.ip_box.setStyleSheet("""
-            QPlainTextEdit {
-                background-color: #1F1F1F;
-                color: white;
-                border: 1px solid #333333;
-                border-radius: 6px;
-            }
-        """)
-
-        self.name_box = QPlainTextEdit()
-        self.name_box.setPlaceholderText("Optional: Names matching IP order")
-        self.name_box.setStyleSheet("""
-            QPlainTextEdit {
-                background-color: #1F1F1F;
-                color: white;
-                border: 1px solid #333333;
-                border-radius: 6px;
-            }
-        """)
-
-        row.addWidget(self.ip_box, 1)
-        row.addWidget(self.name_box, 1)
-        content.addLayout(row)
-
-        # Toolbar
-        tools = QFrame()
-        tools.setStyleSheet("""
-            QFrame {
-                background-color: #2B2B1F;
-                border: 1px solid #4A4A32;
-                border-radius: 8px;
-            }
-        """)
-        t_layout = QHBoxLayout(tools)
-        t_layout.setContentsMargins(10, 6, 10, 6)
-
-        self.btn_generate = QPushButton("Generate")
-        self.btn_start = QPushButton("Start All")
-        self.btn_stop = QPushButton("Stop All")
-        self.btn_delete = QPushButton("Delete All")
-        self.btn_export = QPushButton("Export")
-        self.btn_help = QPushButton("?")
-        self.btn_help.setFixedWidth(32)
-
-        for b in (self.btn_generate, self.btn_start, self.btn_stop, self.btn_delete, self.btn_export, self.btn_help):
-            b.setCursor(Qt.PointingHandCursor)
-
-        t_layout.addWidget(self.btn_generate)
-        t_layout.addWidget(self.btn_start)
-        t_layout.addWidget(self.btn_stop)
-        t_layout.addWidget(self.btn_delete)
-        t_layout.addWidget(self.btn_export)
-        t_layout.addStretch()
-        t_layout.addWidget(self.btn_help)
-
-        tools.setStyleSheet(tools.styleSheet() + """
-            QPushButton {
-                background-color: #3A3A2A;
-                color: white;
-                padding: 4px 12px;
-                border-radius: 6px;
-                border: 1px solid #55553A;
-            }
-            QPushButton:hover {
-                background-color: #545438;
-            }
-        """)
-
-        content.addWidget(tools)
-
-        # Scroll area for widgets
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_content = QWidget()
-        self.container = QVBoxLayout(scroll_content)
-        self.container.setContentsMargins(4, 4, 4, 4)
-        scroll.setWidget(scroll_content)
-
-        content.addWidget(scroll)
-
-        root.addLayout(content)
-        self.setLayout(root)
-
-        # Signals
-        self.btn_generate.clicked.connect(self.generate_windows)
-        self.btn_start.clicked.connect(self.start_all)
-        self.btn_stop.clicked.connect(self.stop_all)
-        self.btn_delete.clicked.connect(self.delete_all)
-        self.btn_export.clicked.connect(self.export_results)
-        self.btn_help.clicked.connect(self.show_help)
-
-    # ---------------------------------------------------------
-    # Window Actions
-    # ---------------------------------------------------------
-    def generate_windows(self):
-        ips = self.ip_box.toPlainText().splitlines()
-        names = self.name_box.toPlainText().splitlines()
-
-        for idx, raw in enumerate(ips):
-            ip = raw.strip()
-            if not ip:
-                continue
-            if ip in self.existing_ips:
-                continue
-
-            name = names[idx].strip() if idx < len(names) else ""
-
-            widget = PingWidget(self, ip, name)
-            self.widgets.append(widget)
-            self.existing_ips.add(ip)
-            self.ping_results[ip] = ("Unknown", name)
-
-            self.container.addWidget(widget)
-
-    def remove_widget(self, widget: PingWidget):
-        widget.thread_running = False
-        if widget.ip in self.existing_ips:
-            self.existing_ips.remove(widget.ip)
-        if widget.ip in self.ping_results:
-            del self.ping_results[widget.ip]
-
-        if widget in self.widgets:
-            self.widgets.remove(widget)
-
-        widget.setParent(None)
-        widget.deleteLater()
-
-    def start_all(self):
-        for w in self.widgets:
-            w.start_ping()
-
-    def stop_all(self):
-        for w in self.widgets:
-            w.stop_ping()
-
-    def delete_all(self):
-        if not self.widgets:
-            return
-
-        if QMessageBox.question(
-            self, "Confirm delete",
-            "Delete all ping windows?",
-            QMessageBox.Yes | QMessageBox.No
-        ) == QMessageBox.Yes:
-            for w in list(self.widgets):
-                self.remove_widget(w)
-
-    # ---------------------------------------------------------
-    # Export
-    # ---------------------------------------------------------
-    def export_results(self):
-        if not self.ping_results:
-            QMessageBox.information(self, "Export", "No results to export.")
-            return
-
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Save Results", "Ping_Results.xlsx", "Excel Files (*.xlsx)"
-        )
-        if not path:
-            return
-
-        if not path.lower().endswith(".xlsx"):
-            path += ".xlsx"
-
-        df = pd.DataFrame({
-            "Name": [v[1] for v in self.ping_results.values()],
-            "IP Address": list(self.ping_results.keys()),
-            "Status": [v[0] for v in self.ping_results.values()]
-        })
-
-        try:
-            df.to_excel(path, index=False)
-            QMessageBox.information(self, "Export", f"Saved:\n{path}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-
-    # ---------------------------------------------------------
-    # Help
-    # ---------------------------------------------------------
-    def show_help(self):
-        dlg = HelpDialog()
-        dlg.exec_()
-
-
-# ---------------------------------------------------------
-# Run App
-# ---------------------------------------------------------
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-
-    icon_path = Path(__file__).parent / "pingops_final.ico"
-    app.setWindowIcon(QIcon(str(icon_path)))
-
-    win = MainWindow()
-    win.show()
-    sys.exit(app.exec_())
+"""
+PingOps v1.1
+Developer: ASG-DEVS (Abdullah Saad Alghamdi)
+
+A lightweight multi-IP monitoring tool for Network & NOC engineers.
+Features:
+- Multiple simultaneous ping windows
+- Real-time UP/DOWN/FLAPPING detection
+- Continuous ping
+- Names/labels per IP
+- Excel export
+- Clean PyQt5 dark UI
+"""
+
+import sys
+import os
+import asyncio
+import ipaddress
+import queue
+import socket
+import struct
+import subprocess
+import threading
+import time
+import platform
+from itertools import zip_longest
+from pathlib import Path
+
+from PyQt5.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
+    QLabel, QPlainTextEdit, QScrollArea, QFrame, QMessageBox,
+    QDialog, QFileDialog
+)
+from PyQt5.QtGui import QIcon
+from PyQt5.QtCore import Qt, QThread, QTimer
+
+# Optional native ICMP backend (compiled extension) for the fallback
+# path; without it we keep shelling out to the system ping binary.
+try:
+    from ping_rs import ping_once as _native_ping
+except ImportError:
+    _native_ping = None
+
+# Constant for the process lifetime — computed once, not per tick.
+_IS_WIN = platform.system().lower() == "windows"
+# Continuous ping: one process per target, one output line per sample.
+_STREAM_CMD = ["ping", "-t"] if _IS_WIN else ["ping", "-i", "1"]
+
+_STARTUPINFO = None
+if _IS_WIN:
+    _STARTUPINFO = subprocess.STARTUPINFO()
+    _STARTUPINFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+
+
+def _is_reply(line: str) -> bool:
+    """True for a successful echo line from any backend.
+
+    Windows ping prints "Reply from x: bytes=32 ...", POSIX ping
+    prints "64 bytes from x: icmp_seq=1 ...".
+    """
+    return "Reply from" in line or "bytes=" in line or "bytes from" in line
+
+
+def _native_one_ping(ip: str) -> str:
+    """One blocking ping via the ping_rs backend; returns a reply line."""
+    r = _native_ping(ip, timeout_ms=1000)
+    if r.is_success():
+        return f"Reply from {ip}: time={r.duration_ms}ms"
+    return "Request timed out."
+
+
+# ---------------------------------------------------------
+# Resource Path (supports PyInstaller EXE)
+# ---------------------------------------------------------
+def resource_path(relative_path: str) -> str:
+    """Return absolute path to resource for both script & PyInstaller."""
+    base_path = getattr(sys, "_MEIPASS", Path(__file__).parent)
+    return str(Path(base_path) / relative_path)
+
+
+_APP_ICON = None
+_APP_PIXMAP = None
+
+
+def _app_icon() -> QIcon:
+    """Cached application icon — decode the ICO once per process."""
+    global _APP_ICON
+    if _APP_ICON is None:
+        _APP_ICON = QIcon(resource_path("pingops_final.ico"))
+    return _APP_ICON
+
+
+def _app_pixmap():
+    """Cached 22x22 pixmap of the application icon."""
+    global _APP_PIXMAP
+    if _APP_PIXMAP is None:
+        _APP_PIXMAP = _app_icon().pixmap(22, 22)
+    return _APP_PIXMAP
+
+
+def _confirm_delete(parent, text: str, on_yes):
+    """Non-modal Yes/No confirmation that calls on_yes if confirmed.
+
+    QMessageBox.question spins a nested event loop, which stalls the
+    queued status updates until the dialog closes; open() keeps them
+    flowing while the box is up.
+    """
+    box = QMessageBox(parent)
+    # open() only hides the box on close; without this every
+    # confirmation would pile up on the parent for the session.
+    box.setAttribute(Qt.WA_DeleteOnClose)
+    box.setIcon(QMessageBox.Question)
+    box.setWindowTitle("Confirm delete")
+    box.setText(text)
+    box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+    box.buttonClicked.connect(
+        lambda b: on_yes() if box.standardButton(b) == QMessageBox.Yes else None
+    )
+    box.open()
+
+
+# ---------------------------------------------------------
+# Shared ICMP Ping Engine
+# ---------------------------------------------------------
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_PAYLOAD = b"PingOps"
+_PING_INTERVAL = 1.0  # seconds between echo batches
+_PING_TIMEOUT = 1.0   # seconds before an echo counts as lost
+_STREAM_READ_TIMEOUT = 2.0  # seconds of silence before a streamed ping counts as lost
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """RFC 1071 internet checksum over an ICMP packet."""
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(
+        int.from_bytes(data[i:i + 2], "big")
+        for i in range(0, len(data), 2)
+    )
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+class PingEngine(QThread):
+    """Drives all pings from one ICMP socket and one asyncio loop.
+
+    Instead of one thread + one ``ping`` subprocess per widget, every
+    registered target shares a single socket. Each tick the engine
+    submits the whole batch of echo requests back-to-back, then picks
+    up replies as the socket becomes readable and routes them to the
+    owning widget by source address. Targets the socket cannot serve
+    (no permission for ICMP sockets, non-IPv4 addresses) are pinged
+    with asyncio subprocesses on the same loop, so the thread count
+    stays at one engine thread however many targets are registered.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._sock, self._raw_replies = self._open_socket()
+        self._targets = {}    # ip -> PingWidget (touched only on the loop)
+        self._pending = {}    # ip -> monotonic send time of the last echo
+        self._sub_tasks = {}  # ip -> asyncio.Task of the subprocess loop
+        self._ident = os.getpid() & 0xFFFF
+        self._seq = 0
+        self._loop = None
+        self._started = threading.Event()
+
+    @staticmethod
+    def _open_socket():
+        """Return (socket, replies_include_ip_header), or (None, False)."""
+        for kind, raw in ((socket.SOCK_DGRAM, False), (socket.SOCK_RAW, True)):
+            try:
+                sock = socket.socket(socket.AF_INET, kind, socket.IPPROTO_ICMP)
+            except OSError:
+                continue
+            sock.setblocking(False)
+            return sock, raw
+        return None, False
+
+    # ---------------- GUI-thread API ----------------
+    def register(self, widget):
+        """Begin pinging widget.ip on the engine loop."""
+        if not self.isRunning():
+            self.start()
+            self._started.wait()
+        self._loop.call_soon_threadsafe(self._add_target, widget)
+
+    def unregister(self, widget):
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._forget, widget.ip)
+
+    def shutdown(self):
+        if self.isRunning():
+            self._loop.call_soon_threadsafe(self._begin_shutdown)
+            self.wait(2000)
+
+    def _begin_shutdown(self):
+        """Cancel the fallback tasks, then stop the loop once they are
+        done — their finally blocks terminate the streamed ping
+        children, which would otherwise outlive the app.
+        """
+        tasks = [t for t in self._sub_tasks.values() if not t.done()]
+        self._sub_tasks.clear()
+        if not tasks:
+            self._loop.stop()
+            return
+        for task in tasks:
+            task.cancel()
+        gathered = asyncio.gather(*tasks, return_exceptions=True)
+        gathered.add_done_callback(lambda _f: self._loop.stop())
+
+    # ---------------- engine thread ----------------
+    def run(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        if self._sock is not None:
+            try:
+                self._loop.add_reader(self._sock.fileno(), self._read_replies)
+            except NotImplementedError:
+                # Proactor loops (Windows) cannot watch ICMP sockets;
+                # every target uses the subprocess path instead.
+                self._sock.close()
+                self._sock = None
+        if self._sock is not None:
+            self._loop.create_task(self._tick())
+        self._started.set()
+        try:
+            self._loop.run_forever()
+        finally:
+            self._loop.close()
+
+    def _socket_serves(self, ip: str) -> bool:
+        if self._sock is None:
+            return False
+        try:
+            socket.inet_aton(ip)
+        except OSError:
+            return False
+        return True
+
+    def _add_target(self, widget):
+        ip = widget.ip
+        if ip in self._targets:
+            return
+        self._targets[ip] = widget
+        if not self._socket_serves(ip):
+            self._sub_tasks[ip] = self._loop.create_task(
+                self._fallback_loop(ip)
+            )
+
+    def _forget(self, ip: str):
+        self._targets.pop(ip, None)
+        self._pending.pop(ip, None)
+        task = self._sub_tasks.pop(ip, None)
+        if task is not None:
+            task.cancel()
+
+    def _report(self, ip: str, line: str):
+        widget = self._targets.get(ip)
+        if widget is not None:
+            widget.main_window._update_queue.put((widget, line))
+
+    def _build_packet(self) -> bytes:
+        header = struct.pack(
+            "!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, self._ident, self._seq
+        )
+        checksum = _icmp_checksum(header + _ICMP_PAYLOAD)
+        return struct.pack(
+            "!BBHHH", _ICMP_ECHO_REQUEST, 0, checksum, self._ident, self._seq
+        ) + _ICMP_PAYLOAD
+
+    async def _tick(self):
+        while True:
+            # Sweep echoes that never got a reply.
+            now = time.monotonic()
+            for ip, sent in list(self._pending.items()):
+                if now - sent >= _PING_TIMEOUT:
+                    del self._pending[ip]
+                    self._report(ip, "Request timed out.")
+
+            # Submit the next batch of echo requests in one pass.
+            self._seq = (self._seq + 1) & 0xFFFF
+            packet = self._build_packet()
+            for ip in list(self._targets):
+                if ip in self._pending or ip in self._sub_tasks:
+                    continue
+                try:
+                    self._sock.sendto(packet, (ip, 0))
+                except OSError:
+                    self._report(ip, "Request timed out.")
+                else:
+                    self._pending[ip] = time.monotonic()
+
+            await asyncio.sleep(_PING_INTERVAL)
+
+    def _read_replies(self):
+        while True:
+            try:
+                data, addr = self._sock.recvfrom(2048)
+            except OSError:
+                return
+
+            ip = addr[0]
+            if self._raw_replies:
+                data = data[(data[0] & 0x0F) * 4:]
+            if len(data) < 8 or data[0] != _ICMP_ECHO_REPLY:
+                continue
+
+            # A raw socket sees every echo reply on the host; keep only
+            # ours by identifier. (The kernel already demuxes by id on
+            # the SOCK_DGRAM path, and rewrites it, so skip the check.)
+            if self._raw_replies and int.from_bytes(data[4:6], "big") != self._ident:
+                continue
+
+            sent = self._pending.pop(ip, None)
+            if sent is None:
+                continue
+            rtt = (time.monotonic() - sent) * 1000.0
+            self._report(ip, f"Reply from {ip}: time={rtt:.0f}ms")
+
+    async def _native_ping_loop(self, ip: str):
+        """Fallback pings through the native backend, one per interval."""
+        while ip in self._sub_tasks:
+            started = time.monotonic()
+            line = await self._loop.run_in_executor(
+                None, _native_one_ping, ip
+            )
+            self._report(ip, line)
+            # Pace like the socket path: one echo per interval.
+            elapsed = time.monotonic() - started
+            if elapsed < _PING_INTERVAL:
+                await asyncio.sleep(_PING_INTERVAL - elapsed)
+
+    async def _stream_ping_loop(self, ip: str):
+        """Fallback pings from one persistent ping process per target.
+
+        The process is spawned once and its stdout streamed line by
+        line — one line per sample, no fork/exec per tick. Prolonged
+        silence counts as a lost packet because ping prints nothing
+        for unanswered echoes on some platforms.
+        """
+        while ip in self._sub_tasks:
+            proc = await asyncio.create_subprocess_exec(
+                *_STREAM_CMD, ip,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                startupinfo=_STARTUPINFO
+            )
+            try:
+                while ip in self._sub_tasks:
+                    try:
+                        raw = await asyncio.wait_for(
+                            proc.stdout.readline(), _STREAM_READ_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        self._report(ip, "Request timed out.")
+                        continue
+
+                    if not raw:
+                        # ping exited (e.g. resolution failure);
+                        # report and respawn after a beat.
+                        self._report(ip, "Request timed out.")
+                        await asyncio.sleep(_PING_INTERVAL)
+                        break
+
+                    line = raw.decode(errors="replace").strip()
+                    if _is_reply(line):
+                        self._report(ip, line)
+                    elif "timed out" in line.lower() or "unreachable" in line.lower():
+                        self._report(ip, line)
+                    # Anything else (banner, stats) is not a sample.
+            finally:
+                if proc.returncode is None:
+                    proc.terminate()
+
+    # Bound once at import — the backend choice is fixed per process.
+    _fallback_loop = (
+        _native_ping_loop if _native_ping is not None else _stream_ping_loop
+    )
+
+
+# ---------------------------------------------------------
+# Single IP Widget
+# ---------------------------------------------------------
+_FLAP_WINDOW = 16    # UP/DOWN samples of history kept per target
+_FLAP_THRESHOLD = 3  # transitions within the window that mean flapping
+
+
+class PingWidget(QWidget):
+    # All status looks live in one stylesheet per part, parsed once in
+    # __init__; update_status only flips the "state" property and
+    # re-polishes instead of handing Qt a new stylesheet to parse.
+    _PILL_QSS = """
+        QFrame {
+            background-color: #333333;
+            border-radius: 10px;
+            border: 1px solid #555555;
+        }
+        QFrame[state="UP"] {
+            background-color: qlineargradient(
+                x1: 0, y1: 0, x2: 1, y2: 0,
+                stop: 0 #225522, stop: 1 #2E7D32
+            );
+            border: 1px solid #666666;
+        }
+        QFrame[state="DOWN"] {
+            background-color: qlineargradient(
+                x1: 0, y1: 0, x2: 1, y2: 0,
+                stop: 0 #552222, stop: 1 #C62828
+            );
+            border: 1px solid #666666;
+        }
+        QFrame[state="FLAPPING"] {
+            background-color: qlineargradient(
+                x1: 0, y1: 0, x2: 1, y2: 0,
+                stop: 0 #665500, stop: 1 #FBC02D
+            );
+            border: 1px solid #666666;
+        }
+    """
+    _ICON_QSS = """
+        QLabel { color: #AAAAAA; font-size: 18px; }
+        QLabel[state="UP"] { color: #A5D6A7; font-size: 16px; }
+        QLabel[state="DOWN"] { color: #EF9A9A; font-size: 16px; }
+        QLabel[state="FLAPPING"] { color: #FFE082; font-size: 16px; }
+    """
+    _ICON_CHAR = {"UP": "✔", "DOWN": "✖", "FLAPPING": "⚠"}
+
+    def __init__(self, main_window, ip: str, name: str = ""):
+        super().__init__()
+        self.main_window = main_window
+        self.ip = ip
+        self.name = name
+
+        self.thread_running = False
+        self.last_status = None
+        self._last_reply = None
+        # Recent UP/DOWN samples packed into an int, newest in bit 0;
+        # used for FLAPPING detection.
+        self._history = 0
+        self._history_len = 0
+
+        # ---------------- UI Layout ----------------
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(8, 8, 8, 8)
+        main_layout.setSpacing(4)
+
+        # Row 1: IP + Name
+        ip_row = QHBoxLayout()
+        self.ip_label = QLabel(self.ip)
+        self.ip_label.setStyleSheet("color: #FFFFFF; font-size: 13px; font-weight: bold;")
+        ip_row.addWidget(self.ip_label)
+
+        self.name_label = QLabel(self.name)
+        self.name_label.setStyleSheet("color: #CCCCCC; font-size: 12px;")
+        ip_row.addStretch()
+        ip_row.addWidget(self.name_label)
+        main_layout.addLayout(ip_row)
+
+        # Row 2: Status box + Reply
+        status_row = QHBoxLayout()
+
+        self.status_box = QFrame()
+        self.status_box.setFixedSize(130, 32)
+        self.status_box.setStyleSheet(self._PILL_QSS)
+
+        status_inner = QHBoxLayout(self.status_box)
+        status_inner.setContentsMargins(8, 0, 8, 0)
+
+        self.icon_label = QLabel("•")
+        self.icon_label.setStyleSheet(self._ICON_QSS)
+
+        self.status_text = QLabel("Unknown")
+        self.status_text.setStyleSheet("color: #DDDDDD; font-size: 11px;")
+
+        status_inner.addWidget(self.icon_label)
+        status_inner.addWidget(self.status_text)
+
+        status_row.addWidget(self.status_box)
+
+        self.reply_label = QLabel("Waiting...")
+        self.reply_label.setWordWrap(True)
+        self.reply_label.setStyleSheet("color: #BBBBBB; font-size: 11px;")
+        status_row.addWidget(self.reply_label, 1)
+
+        main_layout.addLayout(status_row)
+
+        # Row 3: Buttons
+        btn_row = QHBoxLayout()
+        self.start_btn = QPushButton("Start")
+        self.stop_btn = QPushButton("Stop")
+        self.delete_btn = QPushButton("Delete")
+
+        for b in (self.start_btn, self.stop_btn, self.delete_btn):
+            b.setCursor(Qt.PointingHandCursor)
+
+        btn_row.addWidget(self.start_btn)
+        btn_row.addWidget(self.stop_btn)
+        btn_row.addWidget(self.delete_btn)
+        btn_row.addStretch()
+        main_layout.addLayout(btn_row)
+
+        self.setLayout(main_layout)
+
+        # Connect signals
+        self.start_btn.clicked.connect(self.start_ping)
+        self.stop_btn.clicked.connect(self.stop_ping)
+        self.delete_btn.clicked.connect(self.request_delete)
+
+        # Button Style
+        self.setStyleSheet("""
+            QPushButton {
+                background-color: #3A3A3A;
+                color: white;
+                padding: 4px 10px;
+                border-radius: 6px;
+                border: 1px solid #555555;
+            }
+            QPushButton:hover {
+                background-color: #505050;
+            }
+        """)
+
+    # ---------------------------------------------------------
+    # Delete widget
+    # ---------------------------------------------------------
+    def request_delete(self):
+        _confirm_delete(
+            self, f"Delete ping window for {self.ip}?",
+            lambda: self.main_window.remove_widget(self)
+        )
+
+    # ---------------------------------------------------------
+    # Update Visual Status
+    # ---------------------------------------------------------
+    def update_status(self, reply: str):
+        if _is_reply(reply):
+            status = "UP"
+        else:
+            status = "DOWN"
+
+        # FLAPPING detection: shift the sample into the history word
+        # and count UP/DOWN transitions across the window. A single
+        # lost packet is no longer enough to (permanently) flag the
+        # host — it takes _FLAP_THRESHOLD changes within the last
+        # _FLAP_WINDOW samples.
+        self._history = (
+            (self._history << 1) | (status == "UP")
+        ) & ((1 << _FLAP_WINDOW) - 1)
+        if self._history_len < _FLAP_WINDOW:
+            self._history_len += 1
+
+        mask = (1 << self._history_len) - 1
+        window = self._history & mask
+        transitions = bin((window ^ (window >> 1)) & (mask >> 1)).count("1")
+        if transitions >= _FLAP_THRESHOLD:
+            status = "FLAPPING"
+
+        # Save result in main window
+        self.main_window._statuses[self.ip] = status
+
+        # Steady state: skip the stylesheet work, only refresh the
+        # reply text when it actually changed (e.g. a new RTT).
+        if status == self.last_status:
+            if reply != self._last_reply:
+                self._last_reply = reply
+                self.reply_label.setText(reply)
+            return
+
+        self.last_status = status
+        self._last_reply = reply
+
+        # Apply Styles — flip the state property and re-polish; no new
+        # stylesheet is handed to Qt's parser.
+        for part in (self.status_box, self.icon_label):
+            part.setProperty("state", status)
+            part.style().unpolish(part)
+            part.style().polish(part)
+
+        self.icon_label.setText(self._ICON_CHAR[status])
+        self.status_text.setText(status)
+        self.reply_label.setText(reply)
+
+    # ---------------------------------------------------------
+    # Ping Task
+    # ---------------------------------------------------------
+    def start_ping(self):
+        if not self.thread_running:
+            self.thread_running = True
+            self.main_window.engine.register(self)
+
+    def stop_ping(self):
+        self.thread_running = False
+        self.main_window.engine.unregister(self)
+
+
+# ---------------------------------------------------------
+# Help / About Dialog
+# ---------------------------------------------------------
+class HelpDialog(QDialog):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("About PingOps")
+        self.resize(460, 360)
+        self.setStyleSheet("background-color: #1E1E1E; color: white;")
+
+        layout = QVBoxLayout()
+
+        header = QLabel("PingOps v1.1")
+        header.setStyleSheet("font-size: 20px; font-weight: bold; color: #4CAF50;")
+        layout.addWidget(header)
+
+        text = QLabel()
+        text.setWordWrap(True)
+        text.setTextFormat(Qt.RichText)
+        text.setOpenExternalLinks(True)
+        text.setStyleSheet("font-size: 13px; color: #DDDDDD;")
+        text.setText("""
+<b>English:</b><br>
+PingOps is a lightweight professional IP monitoring tool designed for NOC engineers.<br>
+• Monitor multiple IPs<br>
+• Real-time UP / DOWN / FLAPPING detection<br>
+• Export results to Excel<br><br>
+<b>Developer:</b> Abdullah Al-Ghamdi<br>
+<a href="https://www.linkedin.com/in/abdullah-saad-alghamdi-553b67167/" style="color:#4CAF50;">LinkedIn Profile</a><br><br>
+<hr>
+<b>العربية:</b><br>
+PingOps أداة احترافية لمراقبة الشبكات ومهندسي الـ NOC.<br>
+• مراقبة عدة IPs<br>
+• كشف UP / DOWN / FLAPPING<br>
+• تصدير النتائج لملف Excel<br><br>
+شكراً لاستخدامك PingOps ❤️
+        """)
+        layout.addWidget(text)
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        close_btn.setCursor(Qt.PointingHandCursor)
+        close_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #3A3A3A;
+                color: white;
+                padding: 6px 12px;
+                border-radius: 6px;
+                border: 1px solid #555555;
+            }
+            QPushButton:hover {
+                background-color: #505050;
+            }
+        """)
+        layout.addWidget(close_btn, alignment=Qt.AlignRight)
+
+        self.setLayout(layout)
+
+
+# ---------------------------------------------------------
+# Main Window
+# ---------------------------------------------------------
+class MainWindow(QWidget):
+    def __init__(self):
+        super().__init__()
+
+        self.setWindowTitle("PingOps Dashboard v1.1")
+        self.resize(900, 700)
+        self.setWindowIcon(_app_icon())
+        self.setStyleSheet("background-color: #121212; color: white;")
+
+        # Widgets keyed by IP: the keys double as the dedup set and
+        # removal never scans a list.
+        self.widgets = {}
+        # Results stored column-wise (parallel dicts keyed by IP) so
+        # export hands pandas ready-made columns without tuple packing.
+        self._names = {}
+        self._statuses = {}
+        self.engine = PingEngine(self)
+
+        # Ping results are queued by workers and drained in batches on
+        # the GUI thread, instead of one cross-thread signal per ping.
+        self._update_queue = queue.SimpleQueue()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._drain_updates)
+        self._flush_timer.start(100)
+
+        root = QVBoxLayout()
+        root.setContentsMargins(0, 0, 0, 0)
+
+        # Top Bar
+        top = QFrame()
+        top.setStyleSheet("""
+            QFrame {
+                background-color: #202020;
+                border-bottom: 1px solid #333333;
+            }
+        """)
+        top_layout = QHBoxLayout(top)
+        top_layout.setContentsMargins(12, 6, 12, 6)
+
+        icon = QLabel()
+        icon.setPixmap(_app_pixmap())
+
+        title = QLabel("PingOps Dashboard v1.1")
+        title.setStyleSheet("font-size: 14px; font-weight: bold;")
+
+        top_layout.addWidget(icon)
+        top_layout.addWidget(title)
+        top_layout.addStretch()
+
+        root.addWidget(top)
+
+        # Content Layout
+        content = QVBoxLayout()
+        content.setContentsMargins(10, 10, 10, 10)
+
+        # Two input text boxes
+        row = QHBoxLayout()
+
+        self.ip_box = QPlainTextEdit()
+        self.ip_box.setPlaceholderText("Paste IP list (one IP per line)")
+        self.ip_box.setStyleSheet("""
+            QPlainTextEdit {
+                background-color: #1F1F1F;
+                color: white;
+                border: 1px solid #333333;
+                border-radius: 6px;
+            }
+        """)
+
+        self.name_box = QPlainTextEdit()
+        self.name_box.setPlaceholderText("Optional: Names matching IP order")
+        self.name_box.setStyleSheet("""
+            QPlainTextEdit {
+                background-color: #1F1F1F;
+                color: white;
+                border: 1px solid #333333;
+                border-radius: 6px;
+            }
+        """)
+
+        row.addWidget(self.ip_box, 1)
+        row.addWidget(self.name_box, 1)
+        content.addLayout(row)
+
+        # Toolbar
+        tools = QFrame()
+        tools.setStyleSheet("""
+            QFrame {
+                background-color: #2B2B1F;
+                border: 1px solid #4A4A32;
+                border-radius: 8px;
+            }
+        """)
+        t_layout = QHBoxLayout(tools)
+        t_layout.setContentsMargins(10, 6, 10, 6)
+
+        self.btn_generate = QPushButton("Generate")
+        self.btn_start = QPushButton("Start All")
+        self.btn_stop = QPushButton("Stop All")
+        self.btn_delete = QPushButton("Delete All")
+        self.btn_export = QPushButton("Export")
+        self.btn_help = QPushButton("?")
+        self.btn_help.setFixedWidth(32)
+
+        for b in (self.btn_generate, self.btn_start, self.btn_stop, self.btn_delete, self.btn_export, self.btn_help):
+            b.setCursor(Qt.PointingHandCursor)
+
+        t_layout.addWidget(self.btn_generate)
+        t_layout.addWidget(self.btn_start)
+        t_layout.addWidget(self.btn_stop)
+        t_layout.addWidget(self.btn_delete)
+        t_layout.addWidget(self.btn_export)
+        t_layout.addStretch()
+        t_layout.addWidget(self.btn_help)
+
+        tools.setStyleSheet(tools.styleSheet() + """
+            QPushButton {
+                background-color: #3A3A2A;
+                color: white;
+                padding: 4px 12px;
+                border-radius: 6px;
+                border: 1px solid #55553A;
+            }
+            QPushButton:hover {
+                background-color: #545438;
+            }
+        """)
+
+        content.addWidget(tools)
+
+        # Scroll area for widgets
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll_content = QWidget()
+        self.container = QVBoxLayout(scroll_content)
+        self.container.setContentsMargins(4, 4, 4, 4)
+        scroll.setWidget(scroll_content)
+
+        content.addWidget(scroll)
+
+        root.addLayout(content)
+        self.setLayout(root)
+
+        # Signals
+        self.btn_generate.clicked.connect(self.generate_windows)
+        self.btn_start.clicked.connect(self.start_all)
+        self.btn_stop.clicked.connect(self.stop_all)
+        self.btn_delete.clicked.connect(self.delete_all)
+        self.btn_export.clicked.connect(self.export_results)
+        self.btn_help.clicked.connect(self.show_help)
+
+    # ---------------------------------------------------------
+    # Window Actions
+    # ---------------------------------------------------------
+    def generate_windows(self):
+        ips = self.ip_box.toPlainText().splitlines()
+        names = self.name_box.toPlainText().splitlines()
+
+        # Suspend repaints while inserting rows in bulk; each addWidget
+        # would otherwise trigger its own layout + paint pass.
+        self.setUpdatesEnabled(False)
+        try:
+            for raw, raw_name in zip_longest(ips, names, fillvalue=""):
+                ip = raw.strip()
+                if not ip:
+                    continue
+
+                # Canonical form (e.g. compressed IPv6) so equivalent
+                # spellings dedup to one target; entries that are not IP
+                # literals, like hostnames, are kept as typed.
+                try:
+                    ip = ipaddress.ip_address(ip).compressed
+                except ValueError:
+                    pass
+
+                if ip in self.widgets:
+                    continue
+
+                name = raw_name.strip()
+
+                widget = PingWidget(self, ip, name)
+                self.widgets[ip] = widget
+                self._names[ip] = name
+                self._statuses[ip] = "Unknown"
+
+                self.container.addWidget(widget)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def remove_widget(self, widget: PingWidget):
+        widget.stop_ping()
+        self.widgets.pop(widget.ip, None)
+        self._names.pop(widget.ip, None)
+        self._statuses.pop(widget.ip, None)
+
+        widget.setParent(None)
+        widget.deleteLater()
+
+    def _drain_updates(self):
+        """Apply all queued ping results in one pass (10 Hz)."""
+        while True:
+            try:
+                widget, line = self._update_queue.get_nowait()
+            except queue.Empty:
+                return
+            if widget.thread_running:
+                widget.update_status(line)
+
+    def start_all(self):
+        for w in self.widgets.values():
+            w.start_ping()
+
+    def stop_all(self):
+        for w in self.widgets.values():
+            w.stop_ping()
+
+    def delete_all(self):
+        if not self.widgets:
+            return
+        _confirm_delete(self, "Delete all ping windows?", self._delete_all_confirmed)
+
+    def _delete_all_confirmed(self):
+        self.setUpdatesEnabled(False)
+        try:
+            for w in list(self.widgets.values()):
+                self.remove_widget(w)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    # ---------------------------------------------------------
+    # Export
+    # ---------------------------------------------------------
+    def export_results(self):
+        if not self._names:
+            QMessageBox.information(self, "Export", "No results to export.")
+            return
+
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save Results", "Ping_Results.xlsx", "Excel Files (*.xlsx)"
+        )
+        if not path:
+            return
+
+        if not path.lower().endswith(".xlsx"):
+            path += ".xlsx"
+
+        # Deferred: pandas costs hundreds of ms at import and most
+        # sessions never export.
+        import pandas as pd
+
+        df = pd.DataFrame.from_records(
+            ((name, ip, self._statuses[ip])
+             for ip, name in self._names.items()),
+            columns=["Name", "IP Address", "Status"]
+        )
+
+        try:
+            try:
+                # xlsxwriter writes noticeably faster than the default
+                # openpyxl engine for plain tables. Its constant-memory
+                # mode is off limits: it drops pandas' column-by-column
+                # cell writes and silently empties all but one column.
+                df.to_excel(path, index=False, engine="xlsxwriter")
+            except ImportError:
+                df.to_excel(path, index=False)
+            QMessageBox.information(self, "Export", f"Saved:\n{path}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+
+    # ---------------------------------------------------------
+    # Help
+    # ---------------------------------------------------------
+    def show_help(self):
+        dlg = HelpDialog()
+        dlg.exec_()
+
+    def closeEvent(self, event):
+        self.engine.shutdown()
+        super().closeEvent(event)
+
+
+# ---------------------------------------------------------
+# Run App
+# ---------------------------------------------------------
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    app.setWindowIcon(_app_icon())
+
+    win = MainWindow()
+    win.show()
+    sys.exit(app.exec_())